@@ -1,29 +1,102 @@
+import argparse
 import datetime
 import re
-import sys
 import urllib.request
+from collections import defaultdict, deque
 
+import numpy as np
 from ortools.sat.python import cp_model
 
 MAP = ""
 MAX_WALLS = 0
-GRID = []
+GRID = b""
+TYPES = np.empty((0, 0), dtype=np.int8)
+BOUNDARY = np.empty((0, 0), dtype=bool)
+IS_HORSE = np.empty((0, 0), dtype=bool)
+IS_LAND = np.empty((0, 0), dtype=bool)
+IS_WATER = np.empty((0, 0), dtype=bool)
+IS_PORTAL = np.empty((0, 0), dtype=bool)
+IS_WALL_ALLOWED = np.empty((0, 0), dtype=bool)
+PORTALS = defaultdict(list)
+PORTAL_EXIT = []
+NEIGHBORS = []
+SUCCESSORS = []
 ROWS = 0
 COLS = 0
 
 
-HORSE = r"H"
-LAND = r"\."
-WATER = r"~"
-WALL = r"W"
-PORTAL = r"[0-9a-z]"
-CHERRY = r"C"
-GOLDEN_CHERRY = r"G"
-BEES = r"S"
-
-
-def is_(cell_type: str, cell: str) -> bool:
-    return re.fullmatch(cell_type, cell) is not None
+HORSE = "H"
+LAND = "."
+WATER = "~"
+WALL = "W"
+PORTAL_CHARS = frozenset("0123456789abcdefghijklmnopqrstuvwxyz")
+CHERRY = "C"
+GOLDEN_CHERRY = "G"
+BEES = "S"
+
+T_HORSE = 0
+T_LAND = 1
+T_WATER = 2
+T_WALL = 3
+T_PORTAL = 4
+T_CHERRY = 5
+T_GOLDEN_CHERRY = 6
+T_BEES = 7
+
+CELL_TYPES = {
+    HORSE: T_HORSE,
+    LAND: T_LAND,
+    WATER: T_WATER,
+    WALL: T_WALL,
+    CHERRY: T_CHERRY,
+    GOLDEN_CHERRY: T_GOLDEN_CHERRY,
+    BEES: T_BEES,
+}
+
+BONUS = {T_CHERRY: 3, T_GOLDEN_CHERRY: 10, T_BEES: -5}
+
+EMOJI = {
+    HORSE: "🐴",
+    LAND: "🟩",
+    WATER: "🟦",
+    WALL: "🟥",
+    CHERRY: "🍒",
+    GOLDEN_CHERRY: "💰",
+    BEES: "🐝",
+}
+
+# T_* code of every byte value, -1 for characters that are not cells.
+CODES = np.full(256, -1, dtype=np.int8)
+CODES[[ord(char) for char in CELL_TYPES]] = list(CELL_TYPES.values())
+CODES[[ord(char) for char in PORTAL_CHARS]] = T_PORTAL
+
+
+def at(r: int, c: int) -> int:
+    """Byte of cell (r, c) in the row-major GRID buffer."""
+    return GRID[r * COLS + c]
+
+
+def classify_grid(lines: list[str]) -> np.ndarray:
+    """Classify every cell once into a T_* code so the model never re-matches."""
+    cols = len(lines[0])
+    rows = []
+    for r, line in enumerate(lines):
+        if len(line) != cols:
+            raise ValueError(f"Row {r} has {len(line)} cells, expected {cols}")
+        try:
+            rows.append(line.encode("ascii"))
+        except UnicodeEncodeError as error:
+            raise ValueError(
+                f"Unknown cell {line[error.start]!r} at {(r, error.start)}"
+            ) from None
+
+    types = CODES[np.frombuffer(b"".join(rows), dtype=np.uint8)]
+    types = types.reshape(len(lines), cols)
+    unknown = np.argwhere(types < 0)
+    if unknown.size:
+        r, c = unknown[0]
+        raise ValueError(f"Unknown cell {lines[r][c]!r} at {(int(r), int(c))}")
+    return types
 
 
 def fetch_puzzle(level_code: str) -> tuple[str, int]:
@@ -38,22 +111,17 @@ def fetch_puzzle(level_code: str) -> tuple[str, int]:
 
 def get_portal_exit(pos):
     i, j = pos
-    cell: str = GRID[i][j]
+    cell = at(i, j)
 
-    assert is_(PORTAL, cell), "Cell is not a portal"
+    assert IS_PORTAL[i, j], "Cell is not a portal"
 
-    for r in range(ROWS):
-        for c in range(COLS):
-            if (r != i or c != j) and GRID[r][c] == cell:
-                return (r, c)
-
-    return None
+    return next((p for p in PORTALS[cell] if p != (i, j)), None)
 
 
 def get_neighbors(pos) -> list[tuple[int, int]]:
     i, j = pos
-    rows = len(GRID)
-    cols = len(GRID[0])
+    rows = ROWS
+    cols = COLS
     positions = []
     if i > 0:
         positions.append((i - 1, j))
@@ -65,10 +133,8 @@ def get_neighbors(pos) -> list[tuple[int, int]]:
         positions.append((i, j + 1))
 
     for ni, nj in positions.copy():
-        cell: str = GRID[ni][nj]
-
-        if is_(PORTAL, cell):
-            portal_pos = get_portal_exit((ni, nj))
+        if IS_PORTAL[ni, nj]:
+            portal_pos = PORTAL_EXIT[ni][nj]
 
             if portal_pos:
                 positions.append(portal_pos)
@@ -76,181 +142,279 @@ def get_neighbors(pos) -> list[tuple[int, int]]:
     return positions
 
 
-def solve_enclose_horse() -> list[list[str]] | None:
+def flood_from_horse(passable: np.ndarray) -> np.ndarray:
+    """BFS distance from the horse through passable cells ignoring walls, -1 if unreached."""
+    dist = np.full((ROWS, COLS), -1)
+    dist[IS_HORSE & passable] = 0
+    queue = deque((int(r), int(c)) for r, c in zip(*np.nonzero(dist == 0)))
+    while queue:
+        pos = queue.popleft()
+        for n in SUCCESSORS[pos[0]][pos[1]]:
+            if passable[n] and dist[n] < 0:
+                dist[n] = dist[pos] + 1
+                queue.append(n)
+
+    return dist
+
+
+def greedy_hint(dist: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+    """Pick the best BFS ball around the horse that walls on its rim can seal.
+
+    The ball of radius k holds every candidate within k steps of the horse; its
+    rim is every non-water cell the ball spreads into. A fully wallable rim
+    within the wall budget gives a feasible (walls, reachable) pair, and the
+    highest-scoring one is returned. None if no radius can be sealed.
+    """
+    best_score, best = None, None
+    for radius in range(int(dist.max()) + 1):
+        ball = (dist >= 0) & (dist <= radius)
+        rim = np.zeros((ROWS, COLS), dtype=bool)
+        for r in range(ROWS):
+            for c in range(COLS):
+                if not ball[r, c] and not IS_WATER[r, c]:
+                    rim[r, c] = any(ball[n] for n in NEIGHBORS[r][c])
+
+        if np.count_nonzero(rim) > MAX_WALLS or (~IS_WALL_ALLOWED[rim]).any():
+            continue
+
+        score = sum(1 + BONUS.get(TYPES[r, c], 0) for r, c in zip(*np.nonzero(ball)))
+        if best_score is None or score > best_score:
+            best_score, best = score, (rim, ball)
+
+    return best
+
+
+def solve_enclose_horse(
+    workers: int = 16, log: bool = False, core: bool = False, hint: bool = True
+) -> tuple[list[list[str]], np.ndarray] | None:
     """Optimize wall placement to maximize score under a wall budget.
 
     Model:
-    - Walls are blocked cells; unreachable cells have distance = -1.
+    - Walls are blocked cells and are never reachable.
     - WATER is always unreachable; walls cannot be placed on WATER, HORSE, CHERRY, GOLDEN_CHERRY, BEES, or PORTAL cells.
-    - HORSE is the only distance 0 cell; other reachable cells have distance >= 1 and must have a reachable neighbor with distance - 1.
+    - HORSE is the flow source; every other reachable cell consumes one unit of flow that
+      arrives through exactly one arc from a reachable neighbor, which ties it to the horse.
     - Reachability spreads through 4-neighbor adjacency and portal links, unless blocked by walls.
     - Boundary LAND/CHERRY/GOLDEN_CHERRY/BEES are forced unreachable.
     - Boundary PORTAL is forced unreachable along with its paired exit.
+    - Cells the horse cannot reach even without walls are fixed unreachable, and only those
+      fed by a reachable candidate keep a wall variable; flow arcs join candidates only.
 
     Objective: maximize sum(reachable) with bonuses: +3 for CHERRY, +10 for GOLDEN_CHERRY, -5 for BEES,
     subject to sum(walls) <= MAX_WALLS.
     Portals are paired by matching digit/lowercase letter; adjacency to a portal includes its exit.
+
+    The search runs on `workers` parallel CP-SAT workers; `log` prints its progress.
+    `core` switches to core-based optimization with the full LP relaxation.
+    `hint` warm-starts the search from `greedy_hint` when it finds a sealed ball.
     """
-    max_dist = sum(1 for r in range(ROWS) for c in range(COLS) if GRID[r][c] != WATER)
+    # Boundary cells cannot be reachable (rules force enclosure at edges);
+    # boundary portals and their paired exits are also forced unreachable.
+    forced_out = BOUNDARY & np.isin(
+        TYPES, (T_LAND, T_CHERRY, T_GOLDEN_CHERRY, T_BEES, T_PORTAL)
+    )
+    for r, c in zip(*np.nonzero(BOUNDARY & IS_PORTAL)):
+        if PORTAL_EXIT[r][c]:
+            forced_out[PORTAL_EXIT[r][c]] = True
+
+    # Cells the horse cannot reach even without any wall are fixed up front;
+    # only cells fed by a reachable candidate keep a wall and a spread clause.
+    dist = flood_from_horse(~IS_WATER & ~forced_out)
+    can_reach = dist >= 0
+    max_flow = max(int(np.count_nonzero(can_reach)) - 1, 0)
+
+    # Only candidates, the cells they feed and the horses are modelled; every
+    # other cell shares a constant 0 for both its wall and its reachability.
+    fed = np.zeros((ROWS, COLS), dtype=bool)
+    for i in range(ROWS):
+        for j in range(COLS):
+            fed[i, j] = any(n != (i, j) and can_reach[n] for n in NEIGHBORS[i][j])
+    modelled = ~IS_WATER & (can_reach | fed | IS_HORSE)
 
     model = cp_model.CpModel()
-    wall = [
-        [model.new_bool_var(f"is_wall_{r}_{c}") for c in range(COLS)]
-        for r in range(ROWS)
-    ]
-    reachable = [
-        [model.new_bool_var(f"reachable_{r}_{c}") for c in range(COLS)]
-        for r in range(ROWS)
-    ]
-    distance = [
-        [model.NewIntVar(-1, max_dist, f"distance_{r}_{c}") for c in range(COLS)]
-        for r in range(ROWS)
-    ]
+    off = model.new_constant(0)
+    # Row-major: the variables of cell (r, c) live at index r * COLS + c.
+    # Variables are left unnamed to skip formatting a name for each one.
+    wall = [model.new_bool_var("") if inside else off for inside in modelled.flat]
+    reachable = [model.new_bool_var("") if inside else off for inside in modelled.flat]
+
+    # Spread links keyed by their unordered endpoints, so each edge is handled
+    # once and duplicated links (an exit that is also adjacent) collapse.
+    links = defaultdict(set)
+    horses = []
+    # Wallable cells grouped by everything the model can tell them apart by.
+    twins = defaultdict(list)
 
     for i in range(ROWS):
         for j in range(COLS):
-            cell: str = GRID[i][j]
-            neighbors = get_neighbors((i, j))
-            is_boundary = i == 0 or i == ROWS - 1 or j == 0 or j == COLS - 1
-
-            model.add(distance[i][j] >= 0).only_enforce_if(reachable[i][j])
-            model.add(distance[i][j] <= -1).only_enforce_if(reachable[i][j].Not())
-            model.add(distance[i][j] == -1).only_enforce_if(wall[i][j])
-
-            if is_(WATER, cell):
-                model.add(wall[i][j] == 0)
-                model.add(distance[i][j] == -1)
-                model.add(reachable[i][j] == 0)
+            if not modelled[i, j]:
                 continue
 
-            if (
-                is_(CHERRY, cell)
-                or is_(GOLDEN_CHERRY, cell)
-                or is_(BEES, cell)
-                or is_(PORTAL, cell)
-            ):
-                model.add(wall[i][j] == 0)
-
-            if is_(HORSE, cell):
-                model.add(reachable[i][j] == 1)
-                model.add(distance[i][j] == 0)
-                model.add(wall[i][j] == 0)
-            else:
-                model.add(distance[i][j] != 0)
-
-            # Boundary cells cannot be reachable (rules force enclosure at edges).
-            if is_boundary and (
-                is_(LAND, cell)
-                or is_(CHERRY, cell)
-                or is_(GOLDEN_CHERRY, cell)
-                or is_(BEES, cell)
-            ):
-                model.add(reachable[i][j] == 0)
-
-            if is_boundary and is_(PORTAL, cell):
-                en, ej = get_portal_exit((i, j))
-
-                # Boundary portals and their paired exits are also forced unreachable.
-                model.add(reachable[i][j] == 0)
-                model.add(reachable[en][ej] == 0)
-
-            for nr, nc in neighbors:
-                model.add(reachable[i][j] == 1).only_enforce_if(
-                    wall[i][j].Not(), reachable[nr][nc]
+            v = i * COLS + j
+            preds = [n for n in NEIGHBORS[i][j] if n != (i, j) and can_reach[n]]
+            model.add_implication(wall[v], reachable[v].Not())
+
+            if IS_WALL_ALLOWED[i, j]:
+                key = (
+                    bool(can_reach[i, j]),
+                    bool(forced_out[i, j]),
+                    frozenset(
+                        n for n in NEIGHBORS[i][j] if n != (i, j) and not IS_WATER[n]
+                    ),
+                    frozenset(
+                        n for n in SUCCESSORS[i][j] if n != (i, j) and not IS_WATER[n]
+                    ),
                 )
+                twins[key].append((i, j))
 
-            is_positive = model.new_bool_var(f"is_positive_{i}_{j}")
-            model.add(distance[i][j] >= 1).only_enforce_if(is_positive)
-            model.add(distance[i][j] <= 0).only_enforce_if(is_positive.Not())
-
-            preds = []
-            for nr, nc in neighbors:
-                pred = model.new_bool_var(f"pred_{i}_{j}_{nr}_{nc}")
-                model.add(distance[i][j] == distance[nr][nc] + 1).only_enforce_if(pred)
-                model.add(reachable[nr][nc] == 1).only_enforce_if(pred)
-                preds.append(pred)
-
-            if preds:
-                model.add_bool_or(preds).only_enforce_if(is_positive)
             else:
-                model.add(is_positive == 0)
+                model.add(wall[v] == 0)
+
+            if IS_HORSE[i, j]:
+                model.add(reachable[v] == 1)
+                horses.append((i, j))
+
+            if not can_reach[i, j]:
+                model.add(reachable[v] == 0)
+
+            for n in preds:
+                links[min(n, (i, j)), max(n, (i, j))].add((n, (i, j)))
+
+    # A reachable neighbor makes a non-wall cell reachable too.
+    for edge in sorted(links):
+        for (nr, nc), (i, j) in sorted(links[edge]):
+            u, v = nr * COLS + nc, i * COLS + j
+            model.add_bool_or([wall[v], reachable[u].Not(), reachable[v]])
+
+    # Swapping two twins maps any solution onto another with the same score, so
+    # order their walls. Equal walls already imply equal reachability, since
+    # twins share their predecessors.
+    for cells in twins.values():
+        for (ar, ac), (br, bc) in zip(cells, cells[1:]):
+            model.add(wall[ar * COLS + ac] >= wall[br * COLS + bc])
+
+    # Connectivity: the horses send one unit of flow to every other reachable
+    # cell. Each reachable cell picks exactly one reachable parent arc, and
+    # flow can only travel along picked arcs, so every reachable cell is tied
+    # back to a horse.
+    parents = defaultdict(list)
+    for edge in sorted(links):
+        for (ur, uc), (vr, vc) in sorted(links[edge]):
+            if can_reach[vr, vc] and not IS_HORSE[vr, vc]:
+                parents[vr * COLS + vc].append(ur * COLS + uc)
+
+    incoming = defaultdict(list)
+    outgoing = defaultdict(list)
+    for v, us in parents.items():
+        for u in us:
+            # A corridor cell's only arc is picked exactly when the cell is
+            # reachable, so it reuses that literal instead of a fresh one.
+            use = reachable[v] if len(us) == 1 else model.new_bool_var("")
+            flow = model.new_int_var(0, max_flow, "")
+            model.add_implication(use, reachable[u])
+            model.add(flow <= max_flow * use)
+            incoming[v].append((use, flow))
+            outgoing[u].append(flow)
+
+    for v in np.flatnonzero(can_reach & ~IS_HORSE):
+        arcs = incoming[v]
+        if len(arcs) != 1:
+            model.add(cp_model.LinearExpr.sum([use for use, _ in arcs]) == reachable[v])
+        model.add(
+            cp_model.LinearExpr.sum([flow for _, flow in arcs])
+            - cp_model.LinearExpr.sum(outgoing[v])
+            == reachable[v]
+        )
+
+    model.add(
+        cp_model.LinearExpr.sum(
+            [flow for r, c in horses for flow in outgoing[r * COLS + c]]
+        )
+        == cp_model.LinearExpr.sum(reachable) - len(horses)
+    )
 
-    model.add(sum(wall[r][c] for r in range(ROWS) for c in range(COLS)) <= MAX_WALLS)
+    model.add(cp_model.LinearExpr.sum(wall) <= MAX_WALLS)
 
-    score = 0
+    # Each reachable cell scores 1 plus its bonus.
+    weights = [1 + BONUS.get(TYPES[r, c], 0) for r in range(ROWS) for c in range(COLS)]
+    model.maximize(cp_model.LinearExpr.weighted_sum(reachable, weights))
 
-    for r in range(ROWS):
-        for c in range(COLS):
-            cell: str = GRID[r][c]
-            score += reachable[r][c]
-
-            if is_(CHERRY, cell):
-                score += reachable[r][c] * 3
-            elif is_(GOLDEN_CHERRY, cell):
-                score += reachable[r][c] * 10
-            elif is_(BEES, cell):
-                score += reachable[r][c] * -5
-
-    model.maximize(score)
+    seed = greedy_hint(dist) if hint else None
+    if seed is not None:
+        hint_walls, hint_reachable = seed
+        for v in np.flatnonzero(modelled):
+            model.add_hint(wall[v], int(hint_walls.flat[v]))
+            model.add_hint(reachable[v], int(hint_reachable.flat[v]))
 
     solver = cp_model.CpSolver()
+    solver.parameters.num_workers = workers
+    solver.parameters.log_search_progress = log
+    if core:
+        solver.parameters.linearization_level = 2
+        solver.parameters.optimize_with_core = True
+        solver.parameters.core_minimization_level = 1
     status = solver.Solve(model)
 
     if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
         print("unsat")
         return None
 
-    print(
-        "Walls used:",
-        sum(1 for r in range(ROWS) for c in range(COLS) if solver.Value(wall[r][c])),
-    )
+    # Read the whole assignment once and gather each grid from it.
+    solution = np.asarray(solver.response_proto.solution)
+    walls = solution[[var.index for var in wall]].reshape(ROWS, COLS).astype(bool)
+    reached = solution[[var.index for var in reachable]].reshape(ROWS, COLS)
+
+    print("Walls used:", int(walls.sum()))
     print("Objective value:", int(solver.ObjectiveValue()))
 
     return [
-        [WALL if solver.Value(wall[r][c]) else GRID[r][c] for c in range(COLS)]
+        [WALL if walls[r, c] else chr(at(r, c)) for c in range(COLS)]
         for r in range(ROWS)
-    ], [[solver.Value(reachable[r][c]) for c in range(COLS)] for r in range(ROWS)]
-
-
-def render_grid(grid: list[list[str]]) -> str:
-    emojis = {
-        HORSE: "🐴",
-        LAND: "🟩",
-        WATER: "🟦",
-        WALL: "🟥",
-        PORTAL: "🌀",
-        CHERRY: "🍒",
-        GOLDEN_CHERRY: "💰",
-        BEES: "🐝",
-    }
-    lines = []
-    for row in grid:
-        cells = []
-        for cell in row:
-            for cell_type, emoji in emojis.items():
-                if is_(cell_type, cell):
-                    cells.append(emoji)
-                    break
-
-        lines.append("".join(cells))
-    return "\n".join(lines)
-
-
-def render_reachable(grid: list[list[str]], reachable: list[list[bool]]) -> str:
-    lines = []
-    for r in range(len(grid)):
-        cells = []
-        for c in range(len(grid[0])):
-            if reachable[r][c]:
-                cells.append("✅")
-            else:
-                cells.append("❌")
-        lines.append("".join(cells))
-    return "\n".join(lines)
+    ], reached.astype(bool)
+
+
+def render_both(grid: list[list[str]], reachable: np.ndarray) -> tuple[str, str]:
+    """Render the solved grid and its reachability map in a single pass."""
+    grid_lines = []
+    reachable_lines = []
+    for row, reach_row in zip(grid, reachable):
+        grid_cells = [""] * len(row)
+        reachable_cells = [""] * len(row)
+        for c, cell in enumerate(row):
+            grid_cells[c] = EMOJI.get(cell) or ("🌀" if cell in PORTAL_CHARS else cell)
+            reachable_cells[c] = "✅" if reach_row[c] else "❌"
+
+        grid_lines.append("".join(grid_cells))
+        reachable_lines.append("".join(reachable_cells))
+    return "\n".join(grid_lines), "\n".join(reachable_lines)
 
 
 if __name__ == "__main__":
-    level_code = sys.argv[1] if len(sys.argv) > 1 else datetime.date.today().isoformat()
+    parser = argparse.ArgumentParser(description="Solve an enclose.horse puzzle.")
+    parser.add_argument(
+        "level_code",
+        nargs="?",
+        default=datetime.date.today().isoformat(),
+        help="daily date (YYYY-MM-DD) or community level code; defaults to today",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=16, help="CP-SAT search workers (default: 16)"
+    )
+    parser.add_argument(
+        "--log", action="store_true", help="print CP-SAT search progress"
+    )
+    parser.add_argument(
+        "--core",
+        action="store_true",
+        help="use core-based optimization with linearization level 2",
+    )
+    parser.add_argument(
+        "--no-hint",
+        action="store_true",
+        help="do not warm-start the search with the greedy wall placement",
+    )
+    args = parser.parse_args()
+    level_code = args.level_code
 
     MAP, MAX_WALLS = fetch_puzzle(level_code)
 
@@ -259,11 +423,37 @@ if __name__ == "__main__":
     print(MAP)
     print()
 
-    GRID = [list(line) for line in MAP.strip().split("\n")]
-    ROWS = len(GRID)
-    COLS = len(GRID[0])
+    lines = MAP.strip().split("\n")
+    ROWS = len(lines)
+    COLS = len(lines[0])
+    TYPES = classify_grid(lines)
+    GRID = "".join(lines).encode("ascii")
+    BOUNDARY = np.zeros((ROWS, COLS), dtype=bool)
+    BOUNDARY[[0, -1], :] = True
+    BOUNDARY[:, [0, -1]] = True
+    IS_HORSE = TYPES == T_HORSE
+    IS_LAND = TYPES == T_LAND
+    IS_WATER = TYPES == T_WATER
+    IS_PORTAL = TYPES == T_PORTAL
+    IS_WALL_ALLOWED = IS_LAND | (TYPES == T_WALL)
+    PORTALS = defaultdict(list)
+    for r, c in zip(*np.nonzero(IS_PORTAL)):
+        PORTALS[at(r, c)].append((int(r), int(c)))
+    PORTAL_EXIT = [
+        [get_portal_exit((r, c)) if IS_PORTAL[r, c] else None for c in range(COLS)]
+        for r in range(ROWS)
+    ]
+    NEIGHBORS = [[get_neighbors((r, c)) for c in range(COLS)] for r in range(ROWS)]
+    SUCCESSORS = [[[] for c in range(COLS)] for r in range(ROWS)]
+    for r in range(ROWS):
+        for c in range(COLS):
+            for nr, nc in NEIGHBORS[r][c]:
+                SUCCESSORS[nr][nc].append((r, c))
 
-    solved_grid, reachable = solve_enclose_horse()
+    solved_grid, reachable = solve_enclose_horse(
+        workers=args.workers, log=args.log, core=args.core, hint=not args.no_hint
+    )
 
-    print(render_grid(solved_grid))
-    print(render_reachable(solved_grid, reachable))
+    grid_str, reachable_str = render_both(solved_grid, reachable)
+    print(grid_str)
+    print(reachable_str)